@@ -10,20 +10,47 @@ NOTE: This script sends via Telegram Bot API directly.
 
 from __future__ import annotations
 
+import base64
+import calendar
+import functools
+import hashlib
+import http.client
 import io
 import json
+import math
 import os
+import queue
+import random
+import select
 import subprocess
+import tempfile
+import threading
+import time
+import urllib.parse
 import urllib.request
-from datetime import datetime
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:  # Pillow stays optional at runtime (text fallback)
+    from PIL import Image, ImageFont
 
 
 TELEGRAM_CHAT_ID = "REDACTED_CHAT_ID"
 
+CACHE_DIR = os.path.expanduser("~/.cache/morning_dashboard")
+
+# Open-Meteo updates its models hourly; cached responses are reused within the
+# same TTL-aligned bucket (default: half-hour, i.e. xx:00–xx:29 / xx:30–xx:59).
+try:
+    WEATHER_CACHE_TTL = int(os.environ.get("DASH_WEATHER_TTL", "1800"))
+except ValueError:
+    WEATHER_CACHE_TTL = 1800
+
 
+@functools.lru_cache(maxsize=1)
 def _load_telegram_bot_token() -> str:
-    """Prefer OpenClaw config; fallback to env."""
+    """Prefer OpenClaw config; fallback to env. Resolved once per process."""
     # 1) Env override
     env = os.environ.get("TELEGRAM_BOT_TOKEN")
     if env:
@@ -43,17 +70,126 @@ def _load_telegram_bot_token() -> str:
     raise RuntimeError("Telegram bot token not found (env TELEGRAM_BOT_TOKEN or ~/.openclaw/openclaw.json).")
 
 
+# Idle keep-alive HTTPS connections per host, so Telegram/Open-Meteo calls in
+# one run share a TLS session instead of handshaking per request.
+_https_pool: dict[str, List[http.client.HTTPSConnection]] = {}
+_https_pool_lock = threading.Lock()
+
+
+class _StaleConnection(Exception):
+    """A reused connection failed before the request reached the server."""
+
+
+def _new_https_connection(host: str, timeout: float) -> http.client.HTTPSConnection:
+    """Direct connection, or a CONNECT tunnel via HTTPS_PROXY/https_proxy
+    (honouring no_proxy), as urllib.request.urlopen would do."""
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(host.rsplit(":", 1)[0]):
+        return http.client.HTTPSConnection(host, timeout=timeout)
+
+    p = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    tunnel_headers = {}
+    if p.username:
+        creds = f"{urllib.parse.unquote(p.username)}:{urllib.parse.unquote(p.password or '')}"
+        tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode("utf-8")).decode("ascii")
+    conn = http.client.HTTPSConnection(p.hostname, p.port or 8080, timeout=timeout)
+    conn.set_tunnel(host, headers=tunnel_headers)
+    return conn
+
+
+def _is_dropped(conn: http.client.HTTPSConnection) -> bool:
+    """An idle keep-alive socket that is readable was closed by the server."""
+    if conn.sock is None:
+        return True
+    try:
+        return bool(select.select([conn.sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+def _https_roundtrip(host: str, conn: http.client.HTTPSConnection, method: str, path: str, body, headers: dict, timeout: float, reused: bool) -> Tuple[int, bytes]:
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    try:
+        conn.request(method, path, body=body, headers=headers)
+    except ConnectionError as e:
+        conn.close()
+        if reused:
+            raise _StaleConnection() from e
+        raise
+    except Exception:
+        conn.close()
+        raise
+
+    try:
+        resp = conn.getresponse()
+        data = resp.read()
+    except http.client.RemoteDisconnected as e:
+        conn.close()
+        # The request may have been processed; only GETs are safe to resend
+        # (a second sendPhoto/sendMessage would post the dashboard twice).
+        if reused and method == "GET":
+            raise _StaleConnection() from e
+        raise
+    except Exception:
+        conn.close()
+        raise
+
+    if resp.will_close:
+        conn.close()
+    else:
+        with _https_pool_lock:
+            _https_pool.setdefault(host, []).append(conn)
+    return resp.status, data
+
+
+def _https_request(
+    url: str,
+    method: str = "GET",
+    body=None,
+    headers: dict | None = None,
+    timeout: float = 20,
+) -> Tuple[int, bytes]:
+    """HTTPS request over a pooled connection. Returns (status, body).
+
+    `body` may be bytes or a sequence of bytes chunks (sent back to back).
+    """
+    parts = urllib.parse.urlsplit(url)
+    host = parts.netloc
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    headers = headers or {}
+
+    conn = None
+    with _https_pool_lock:
+        idle = _https_pool.get(host) or []
+        while idle and conn is None:
+            conn = idle.pop()
+            if _is_dropped(conn):
+                conn.close()
+                conn = None
+
+    if conn is not None:
+        try:
+            return _https_roundtrip(host, conn, method, path, body, headers, timeout, reused=True)
+        except _StaleConnection:
+            pass  # failed before reaching the server; retry on a fresh one
+
+    conn = _new_https_connection(host, timeout)
+    return _https_roundtrip(host, conn, method, path, body, headers, timeout, reused=False)
+
+
 def _telegram_api_request(method: str, payload: dict) -> bool:
     token = _load_telegram_bot_token()
     data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
+    _, raw = _https_request(
         f"https://api.telegram.org/bot{token}/{method}",
-        data=data,
-        headers={"Content-Type": "application/json"},
         method="POST",
+        body=data,
+        headers={"Content-Type": "application/json"},
+        timeout=20,
     )
-    with urllib.request.urlopen(req, timeout=20) as resp:
-        result = json.loads(resp.read().decode("utf-8"))
+    result = json.loads(raw.decode("utf-8"))
     ok = bool(result.get("ok"))
     if not ok:
         print(f"❌ Telegram API error ({method}): {result}")
@@ -72,8 +208,8 @@ def send_telegram_message(text: str) -> bool:
         return False
 
 
-def send_telegram_photo(png_bytes: bytes, caption: str | None = None) -> bool:
-    """Send PNG via Telegram Bot API (multipart/form-data)."""
+def send_telegram_photo(image_bytes: bytes, caption: str | None = None, fmt: str = "png") -> bool:
+    """Send PNG/JPEG via Telegram Bot API (multipart/form-data)."""
     token = _load_telegram_bot_token()
 
     boundary = "----openclawboundary7MA4YWxkTrZu0gW"
@@ -86,31 +222,33 @@ def send_telegram_photo(png_bytes: bytes, caption: str | None = None) -> bool:
             f"{value}{crlf}"
         ).encode("utf-8")
 
-    body = bytearray()
-    body += _part("chat_id", TELEGRAM_CHAT_ID)
+    prefix = _part("chat_id", TELEGRAM_CHAT_ID)
     if caption:
-        body += _part("caption", caption)
+        prefix += _part("caption", caption)
 
     # file part
-    body += (
+    ext, mime = ("jpg", "image/jpeg") if fmt == "jpeg" else ("png", "image/png")
+    prefix += (
         f"--{boundary}{crlf}"
-        f"Content-Disposition: form-data; name=\"photo\"; filename=\"dashboard.png\"{crlf}"
-        f"Content-Type: image/png{crlf}{crlf}"
+        f"Content-Disposition: form-data; name=\"photo\"; filename=\"dashboard.{ext}\"{crlf}"
+        f"Content-Type: {mime}{crlf}{crlf}"
     ).encode("utf-8")
-    body += png_bytes
-    body += crlf.encode("utf-8")
-    body += f"--{boundary}--{crlf}".encode("utf-8")
-
-    req = urllib.request.Request(
-        f"https://api.telegram.org/bot{token}/sendPhoto",
-        data=bytes(body),
-        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
-        method="POST",
-    )
+    suffix = f"{crlf}--{boundary}--{crlf}".encode("utf-8")
 
+    # Send the parts back to back instead of concatenating them, so the PNG
+    # image is never copied into a second buffer.
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
+        _, raw = _https_request(
+            f"https://api.telegram.org/bot{token}/sendPhoto",
+            method="POST",
+            body=(prefix, image_bytes, suffix),
+            headers={
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+                "Content-Length": str(len(prefix) + len(image_bytes) + len(suffix)),
+            },
+            timeout=30,
+        )
+        result = json.loads(raw.decode("utf-8"))
         ok = bool(result.get("ok"))
         if not ok:
             print(f"❌ Telegram sendPhoto error: {result}")
@@ -120,49 +258,175 @@ def send_telegram_photo(png_bytes: bytes, caption: str | None = None) -> bool:
         return False
 
 
-def _wind_dir_label(deg: float) -> str:
-    # 0=N, 90=E, 180=S, 270=W
-    dirs = ["N", "NO", "O", "SO", "S", "SW", "W", "NW"]
+# 0=N, 90=E, 180=S, 270=W
+_WIND_DIRS = ("N", "NO", "O", "SO", "S", "SW", "W", "NW")
+
+
+def _wind_dir_label(deg: float | None) -> str:
+    if deg is None or not math.isfinite(deg):
+        return "?"
+    return _WIND_DIRS[int((deg + 22.5) % 360) // 45]
+
+
+WEATHER_LAT, WEATHER_LON = 52.60, 12.34  # Rathenow
+_WEATHER_URL = (
+    "https://api.open-meteo.com/v1/forecast"
+    f"?latitude={WEATHER_LAT}&longitude={WEATHER_LON}"
+    "&current=temperature_2m,relative_humidity_2m,wind_speed_10m,wind_direction_10m,weather_code"
+    "&daily=temperature_2m_max,temperature_2m_min"
+    "&timezone=Europe%2FBerlin"
+)
+
+
+def _weather_cache_path(url: str) -> str:
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"weather_{key}.json")
+
+
+def _read_weather_cache(url: str, fresh_only: bool = True) -> dict | None:
+    """Return the cached Open-Meteo payload for `url`, if any.
+
+    With `fresh_only`, the entry must have been written in the current TTL
+    bucket; otherwise (stale-on-error) it must at least be from today, since
+    older payloads would show another day's Tief/Hoch.
+    """
+    path = _weather_cache_path(url)
+    try:
+        mtime = os.path.getmtime(path)
+        if fresh_only:
+            ttl = max(1, WEATHER_CACHE_TTL)
+            if int(mtime // ttl) != int(time.time() // ttl):
+                return None
+        elif datetime.fromtimestamp(mtime).date() != datetime.now().date():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Write via tmp file + os.replace so readers never see partial files."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp_")
     try:
-        idx = int((deg + 22.5) // 45) % 8
-        return dirs[idx]
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
     except Exception:
-        return "?"
+        os.unlink(tmp)
+        raise
 
 
-def get_weather() -> dict:
-    """Weather via Open-Meteo (no API key). Returns a structured dict.
+def _write_weather_cache(url: str, data: dict) -> None:
+    try:
+        _atomic_write(_weather_cache_path(url), json.dumps(data).encode("utf-8"))
+    except OSError as e:
+        print(f"⚠️ Weather cache write failed: {e}")
 
-    We avoid emoji in rendered text (some fonts show boxes). Icons are drawn
-    in the dashboard image.
+
+def _parse_weather(data: dict) -> dict:
+    """Pick the fields get_weather() uses; raises on a malformed payload.
+
+    Open-Meteo returns every requested field (null if unknown), so index
+    directly. Only validated results are cached, bad payloads get retried.
     """
-    lat, lon = 52.60, 12.34  # Rathenow
-    url = (
-        "https://api.open-meteo.com/v1/forecast"
-        f"?latitude={lat}&longitude={lon}"
-        "&current=temperature_2m,relative_humidity_2m,wind_speed_10m,wind_direction_10m,weather_code"
-        "&daily=temperature_2m_max,temperature_2m_min"
-        "&timezone=Europe%2FBerlin"
-    )
+    cur = data["current"]
+    daily = data["daily"]
+    w = {
+        "t": cur["temperature_2m"],
+        "hum": cur["relative_humidity_2m"],
+        "ws": cur["wind_speed_10m"],
+        "wd": cur["wind_direction_10m"],
+        "wcode": cur["weather_code"],
+        "tmax": daily["temperature_2m_max"][0],
+        "tmin": daily["temperature_2m_min"][0],
+    }
+    if w["t"] is None or w["tmax"] is None or w["tmin"] is None:
+        raise ValueError("missing fields")
+    return w
+
+
+def _get_weather_json(url: str) -> dict:
+    status, raw = _https_request(url, timeout=12)
+    if status != 200:
+        raise ValueError(f"HTTP {status}")
+    return _parse_weather(json.loads(raw.decode("utf-8")))
+
+
+WEATHER_HEDGE_DELAY = 3.0  # seconds before a second, concurrent request is fired
+
+
+def _hedged_weather_request(url: str) -> dict:
+    """Fire a request; if it is still pending after WEATHER_HEDGE_DELAY,
+    fire a second one and take whichever succeeds first.
+
+    Requests run in daemon threads so a slow loser never delays process
+    exit; the total wait is bounded by the 12s socket timeout after the hedge.
+    """
+    results: queue.Queue = queue.Queue()
 
-    for _ in range(3):
+    def _run() -> None:
         try:
-            with urllib.request.urlopen(url, timeout=12) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
+            results.put((True, _get_weather_json(url)))
+        except Exception as e:
+            results.put((False, e))
+
+    deadline = time.monotonic() + WEATHER_HEDGE_DELAY + 12
+    threading.Thread(target=_run, daemon=True).start()
+    try:
+        ok, value = results.get(timeout=WEATHER_HEDGE_DELAY)
+    except queue.Empty:
+        threading.Thread(target=_run, daemon=True).start()  # hedge
+    else:
+        if ok:
+            return value
+        raise value  # failed fast: let the retry loop back off
 
-            cur = data.get("current") or {}
-            daily = data.get("daily") or {}
+    error: Exception = TimeoutError("weather request timed out")
+    for _ in range(2):
+        try:
+            ok, value = results.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            break
+        if ok:
+            return value
+        error = value
+    raise error
+
+
+def _fetch_weather_data(url: str) -> dict | None:
+    """Parsed Open-Meteo fields (see _parse_weather) via cache, network (hedged, 2 retries with
+    exponential backoff + jitter), or stale cache."""
+    cached = _read_weather_cache(url)
+    if cached is not None:
+        return cached
+
+    for attempt in range(3):
+        if attempt:
+            time.sleep(0.5 * 2 ** attempt + random.random() * 0.2)
+        try:
+            data = _hedged_weather_request(url)
+        except Exception:
+            continue
+        _write_weather_cache(url, data)
+        return data
 
-            t = cur.get("temperature_2m")
-            hum = cur.get("relative_humidity_2m")
-            ws = cur.get("wind_speed_10m")
-            wd = cur.get("wind_direction_10m")
-            wcode = cur.get("weather_code")
-            tmax = (daily.get("temperature_2m_max") or [None])[0]
-            tmin = (daily.get("temperature_2m_min") or [None])[0]
+    return _read_weather_cache(url, fresh_only=False)
 
-            if t is None or tmax is None or tmin is None:
-                raise ValueError("missing fields")
+
+def get_weather() -> dict:
+    """Weather via Open-Meteo (no API key). Returns a structured dict.
+
+    We avoid emoji in rendered text (some fonts show boxes). Icons are drawn
+    in the dashboard image.
+    """
+    data = _fetch_weather_data(_WEATHER_URL)
+    if data is not None:
+        try:
+            t, hum, ws, wd = data["t"], data["hum"], data["ws"], data["wd"]
+            wcode, tmax, tmin = data["wcode"], data["tmax"], data["tmin"]
 
             return {
                 "ok": True,
@@ -180,13 +444,41 @@ def get_weather() -> dict:
                 ],
             }
         except Exception:
-            continue
+            pass
 
     return {"ok": False, "weather_code": None, "lines": [("info", "Wetterdaten nicht verfügbar")]}
 
 
+def _khal_events_today() -> List[str]:
+    """Today's events via khal's Python API (no khal subprocess).
+
+    Lines mimic `khal list` output: "HH:MM-HH:MM Title" or just the title
+    for all-day events.
+    """
+    from khal.cli import build_collection
+    from khal.settings import get_config
+
+    conf = get_config()
+    collection = build_collection(conf, None)
+    events = collection.get_events_on(datetime.now().date())
+
+    lines: List[str] = []
+    for ev in sorted(events, key=lambda e: (not e.allday, e.start_local)):
+        if ev.allday:
+            lines.append(ev.summary)
+        else:
+            lines.append(f"{ev.start_local:%H:%M}-{ev.end_local:%H:%M} {ev.summary}")
+    return lines
+
+
 def get_calendar() -> List[str]:
-    """Events via khal."""
+    """Events via khal (Python API; CLI as fallback)."""
+    try:
+        events = _khal_events_today()
+        return events if events else ["Keine Termine"]
+    except Exception:
+        pass  # khal not importable in this interpreter / API mismatch
+
     try:
         result = subprocess.run(
             ["khal", "list", "today", "1d"],
@@ -213,78 +505,97 @@ def get_todos_lines(max_lines: int = 6) -> List[str]:
     section titles like "Übernommen von gestern" as a todo item.
     """
     todo_file = f"/home/clawd/clawd/todos/{datetime.now().strftime('%Y-%m-%d')}.md"
-    if not os.path.exists(todo_file):
-        return ["Keine To-dos für heute"]
-
     try:
         with open(todo_file, "r", encoding="utf-8") as f:
-            raw = f.read().splitlines()
+            # Only keep actual checkbox tasks (headers, blanks and notes never
+            # start with "- [", so lstrip() is enough to filter them out).
+            tasks = [s.rstrip() for s in (ln.lstrip() for ln in f) if s.startswith("- [")]
+    except (OSError, UnicodeDecodeError):  # incl. FileNotFoundError (no file today)
+        return ["Keine To-dos für heute"]
 
-        tasks: List[str] = []
-        for ln in raw:
-            s = ln.strip()
-            if not s:
-                continue
-            if s.startswith("#"):
-                continue
-            # Only keep actual checkbox tasks
-            if s.startswith("- ["):
-                tasks.append(s)
+    if not tasks:
+        return ["Keine To-dos für heute"]
 
-        if not tasks:
-            return ["Keine To-dos für heute"]
+    if len(tasks) > max_lines:
+        return tasks[:max_lines] + [f"… (+{len(tasks) - max_lines} weitere)"]
+    return tasks
 
-        if len(tasks) > max_lines:
-            return tasks[:max_lines] + [f"… (+{len(tasks) - max_lines} weitere)"]
-        return tasks
-    except Exception:
-        return ["Keine To-dos für heute"]
 
+# path -> (mtime, [(month, day, name, year_born), ...])
+_bday_cache: dict[str, Tuple[float, List[Tuple[int, int, str, int | None]]]] = {}
 
-def get_upcoming_birthdays(days: int = 7) -> List[str]:
-    """Get birthdays within the next N days, sorted by proximity.
 
-    Returns formatted strings like:
-    - "Heute: Valentina (26)"
-    - "Morgen: Max (35)"
-    - "in 3 Tagen: Anna (42)"
+def _load_birthdays(path: str) -> List[Tuple[int, int, str, int | None]]:
+    """Parse and validate birthdays.json once per file mtime.
+
+    Entries without day/month or with an impossible date are dropped here,
+    so callers only deal with valid (month, day, name, year_born) tuples.
     """
-    birthdays_file = "/home/clawd/clawd/data/people/birthdays.json"
     try:
-        with open(birthdays_file, "r", encoding="utf-8") as f:
-            birthdays = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        mtime = os.stat(path).st_mtime
+    except OSError:
         return []
 
-    today = datetime.now().date()
-    upcoming: List[Tuple[int, str, int | None]] = []  # (days_until, name, age)
+    cached = _bday_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            birthdays = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return []
 
+    entries: List[Tuple[int, int, str, int | None]] = []
     for name, data in birthdays.items():
         day = data.get("day")
         month = data.get("month")
         if not day or not month:
             continue
-
-        # Calculate days until birthday
         try:
-            birthday_this_year = today.replace(month=month, day=day)
-        except ValueError:
+            datetime(2000, month, day)  # leap year: keeps 29.02.
+            year_born = int(data["year"]) if data.get("year") else None
+        except (TypeError, ValueError):
             continue  # Invalid date
+        entries.append((month, day, name, year_born))
+
+    _bday_cache[path] = (mtime, entries)
+    return entries
+
 
-        if birthday_this_year < today:
+def get_upcoming_birthdays(days: int = 7) -> List[str]:
+    """Get birthdays within the next N days, sorted by proximity.
+
+    Returns formatted strings like:
+    - "Heute: Valentina (26)"
+    - "Morgen: Max (35)"
+    - "in 3 Tagen: Anna (42)"
+    """
+    birthdays_file = "/home/clawd/clawd/data/people/birthdays.json"
+    entries = _load_birthdays(birthdays_file)
+
+    today = datetime.now().date()
+    today_key = (today.month, today.day)
+    this_year_leap = calendar.isleap(today.year)
+    next_year_leap = calendar.isleap(today.year + 1)
+    upcoming: List[Tuple[int, str, int | None]] = []  # (days_until, name, age)
+
+    for month, day, name, year_born in entries:
+        # Calculate days until birthday (29.02. only counts in leap years)
+        if (month, day) >= today_key:
+            if month == 2 and day == 29 and not this_year_leap:
+                continue
+            bday_year = today.year
+        else:
             # Birthday already passed this year, check next year
-            try:
-                birthday_this_year = birthday_this_year.replace(year=today.year + 1)
-            except ValueError:
+            if month == 2 and day == 29 and not next_year_leap:
                 continue
+            bday_year = today.year + 1
 
-        days_until = (birthday_this_year - today).days
+        days_until = (date(bday_year, month, day) - today).days
 
         if days_until <= days:
-            year_born = data.get("year")
-            age = None
-            if year_born:
-                age = birthday_this_year.year - int(year_born)
+            age = bday_year - year_born if year_born else None
             upcoming.append((days_until, name, age))
 
     # Sort by days until (closest first)
@@ -309,6 +620,7 @@ def get_upcoming_birthdays(days: int = 7) -> List[str]:
 
 # ------------------ Image rendering (Pillow) ------------------
 
+@functools.lru_cache(maxsize=1)
 def _find_font() -> str | None:
     candidates = [
         "/home/clawd/clawd/assets/fonts/DejaVuSans.ttf",
@@ -322,23 +634,185 @@ def _find_font() -> str | None:
     return None
 
 
-def _wrap(draw, text: str, font, max_width: int) -> List[str]:
-    words = text.split()
+@functools.lru_cache(maxsize=16)
+def _load_font(size: int) -> "ImageFont.FreeTypeFont":
+    """FreeType face for the dashboard font, loaded once per size."""
+    from PIL import ImageFont
+    font_path = _find_font()
+    if not font_path:
+        raise RuntimeError("No font found on system")
+    return ImageFont.truetype(font_path, size)
+
+
+def _wrap(draw, text: str, font, max_width: int, widths: dict | None = None) -> List[str]:
+    """Greedy word wrap based on advance widths (`font.getlength`).
+
+    Line widths are summed per word instead of re-measuring the whole prefix.
+    `widths` memoizes measurements per (font, token); pass one dict per render.
+    """
+    if widths is None:
+        widths = {}
+    fid = id(font)
+
+    def _len(s: str) -> float:
+        key = (fid, s)
+        v = widths.get(key)
+        if v is None:
+            v = widths[key] = font.getlength(s)
+        return v
+
+    space_w = _len(" ")
     lines: List[str] = []
     cur: List[str] = []
-    for w in words:
-        trial = (" ".join(cur + [w])).strip()
-        bbox = draw.textbbox((0, 0), trial, font=font)
-        if bbox[2] <= max_width or not cur:
+    cur_w = 0.0
+    for w in text.split():
+        w_px = _len(w)
+        if not cur:
+            cur = [w]
+            cur_w = w_px
+        elif cur_w + space_w + w_px <= max_width:
             cur.append(w)
+            cur_w += space_w + w_px
         else:
             lines.append(" ".join(cur))
             cur = [w]
+            cur_w = w_px
     if cur:
         lines.append(" ".join(cur))
     return lines
 
 
+# ---- icon helpers (drawn, not emoji) ----
+# Sizes are fixed, so each sprite is rasterized once per process and shared.
+# Callers only paste them (Image.paste does not mutate the source) - never
+# draw onto a returned icon.
+
+ICON = (230, 236, 245)
+ICON_MUTED = (160, 170, 190)
+
+# Unit vectors of the eight sun rays (0°, 45°, …, 315°), computed once.
+_SUN_RAYS = tuple((math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(0, 360, 45))
+
+
+@functools.lru_cache(maxsize=32)
+def _icon_sun(size: int) -> "Image.Image":
+    from PIL import Image, ImageDraw
+    im = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    d = ImageDraw.Draw(im)
+    cx = cy = size // 2
+    r = int(size * 0.22)
+    d.ellipse((cx - r, cy - r, cx + r, cy + r), outline=ICON, width=6)
+    rr1 = int(size * 0.34)
+    rr2 = int(size * 0.46)
+    for cos_a, sin_a in _SUN_RAYS:
+        x1 = cx + int(rr1 * cos_a)
+        y1 = cy + int(rr1 * sin_a)
+        x2 = cx + int(rr2 * cos_a)
+        y2 = cy + int(rr2 * sin_a)
+        d.line((x1, y1, x2, y2), fill=ICON, width=6)
+    return im
+
+
+@functools.lru_cache(maxsize=32)
+def _icon_cloud(size: int, rain: bool = False, snow: bool = False) -> "Image.Image":
+    from PIL import Image, ImageDraw
+    im = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    d = ImageDraw.Draw(im)
+    y = int(size * 0.46)
+    d.ellipse((int(size * 0.18), y - int(size * 0.18), int(size * 0.44), y + int(size * 0.08)), outline=ICON, width=6)
+    d.ellipse((int(size * 0.36), y - int(size * 0.26), int(size * 0.66), y + int(size * 0.08)), outline=ICON, width=6)
+    d.ellipse((int(size * 0.56), y - int(size * 0.18), int(size * 0.82), y + int(size * 0.08)), outline=ICON, width=6)
+    d.rounded_rectangle((int(size * 0.18), y, int(size * 0.82), int(size * 0.70)), radius=18, outline=ICON, width=6)
+    if rain:
+        for i in range(3):
+            x = int(size * (0.30 + i * 0.18))
+            d.line((x, int(size * 0.74), x - 10, int(size * 0.90)), fill=ICON_MUTED, width=6)
+    if snow:
+        # header font size relative to the 140px weather icon
+        flake = _load_font(max(1, round(size * 2 / 7)))
+        for i in range(3):
+            x = int(size * (0.30 + i * 0.18))
+            d.text((x - 10, int(size * 0.73)), "*", fill=ICON_MUTED, font=flake)
+    return im
+
+
+@functools.lru_cache(maxsize=32)
+def _icon_fog(size: int) -> "Image.Image":
+    from PIL import Image, ImageDraw
+    im = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    # All four bars are identical: draw one and stamp it.
+    x0 = int(size * 0.14)
+    bar_w = int(size * 0.86) - x0
+    bar = Image.new("RGBA", (bar_w + 1, 11), (0, 0, 0, 0))
+    ImageDraw.Draw(bar).rounded_rectangle((0, 0, bar_w, 10), radius=8, outline=ICON_MUTED, width=4)
+    for j in range(4):
+        y = int(size * (0.30 + j * 0.14))
+        im.paste(bar, (x0, y), bar)
+    return im
+
+
+@functools.lru_cache(maxsize=32)
+def _icon_thermo(size: int, updown: str = "") -> "Image.Image":
+    from PIL import Image, ImageDraw
+    im = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    d = ImageDraw.Draw(im)
+    # bulb
+    d.ellipse((int(size*0.36), int(size*0.60), int(size*0.64), int(size*0.88)), outline=ICON, width=6)
+    d.rounded_rectangle((int(size*0.46), int(size*0.18), int(size*0.54), int(size*0.70)), radius=10, outline=ICON, width=6)
+    if updown == "up":
+        d.polygon([(size*0.78, size*0.30), (size*0.90, size*0.48), (size*0.66, size*0.48)], outline=ICON_MUTED)
+    elif updown == "down":
+        d.polygon([(size*0.78, size*0.54), (size*0.90, size*0.36), (size*0.66, size*0.36)], outline=ICON_MUTED)
+    return im
+
+
+@functools.lru_cache(maxsize=32)
+def _icon_drop(size: int) -> "Image.Image":
+    from PIL import Image, ImageDraw
+    im = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    d = ImageDraw.Draw(im)
+    d.polygon([(size*0.50, size*0.18), (size*0.70, size*0.52), (size*0.50, size*0.86), (size*0.30, size*0.52)], outline=ICON, width=6)
+    return im
+
+
+@functools.lru_cache(maxsize=32)
+def _icon_wind(size: int) -> "Image.Image":
+    from PIL import Image, ImageDraw
+    im = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    d = ImageDraw.Draw(im)
+    for j in range(3):
+        y = int(size * (0.32 + j * 0.18))
+        d.arc((int(size*0.10), y, int(size*0.90), y+int(size*0.30)), start=0, end=180, fill=ICON, width=6)
+    return im
+
+
+@functools.lru_cache(maxsize=16)
+def _shadow_sprite(
+    w: int,
+    h: int,
+    radius: int,
+    shadow_rgba: Tuple[int, int, int, int],
+    pad: int = 20,
+    blur: float = 18,
+) -> "Image.Image":
+    """Blurred card shadow (`pad` px on each side). Shared between cards - paste only."""
+    from PIL import Image, ImageDraw, ImageFilter
+    layer = Image.new("RGBA", (w + 2 * pad, h + 2 * pad), (0, 0, 0, 0))
+    d = ImageDraw.Draw(layer)
+    d.rounded_rectangle([pad, pad, pad + w, pad + h], radius=radius, fill=shadow_rgba)
+    return layer.filter(ImageFilter.GaussianBlur(blur))
+
+
+@functools.lru_cache(maxsize=32)
+def _scaled_icon(icon_fn, design_size: int, size: int, **kwargs) -> "Image.Image":
+    """`icon_fn(design_size, **kwargs)` resampled to `size` px (cached)."""
+    from PIL import Image
+    icon = icon_fn(design_size, **kwargs)
+    if size == design_size:
+        return icon
+    return icon.resize((size, size), Image.LANCZOS)
+
+
 def render_dashboard_png(
     title: str,
     subtitle: str,
@@ -346,11 +820,26 @@ def render_dashboard_png(
     calendar: List[str],
     todos: List[str],
     birthdays: List[str],
+    fmt: str = "png",
 ) -> bytes:
+    """Render the dashboard image; `fmt` is "png" or "jpeg"."""
     # Import here so text-only fallback works without Pillow
-    from PIL import Image, ImageDraw, ImageFont, ImageFilter
+    from PIL import Image, ImageDraw
 
-    W, H = 1080, 2340  # portrait (taller for modern iPhones ~19.5:9)
+    # Layout is designed for 1080x2340 (portrait, modern iPhones ~19.5:9) and
+    # rendered at DASH_SCALE (default 0.5): a quarter of the pixels to blur,
+    # composite and encode. Telegram upscales for display; 1.0 = full size.
+    try:
+        scale = float(os.environ.get("DASH_SCALE", "0.5"))
+    except ValueError:
+        scale = 0.5
+    if not 0 < scale <= 2:
+        scale = 0.5
+
+    def px(v: float) -> int:
+        return max(1, round(v * scale))
+
+    W, H = px(1080), px(2340)
 
     style = os.environ.get("DASH_STYLE", "cards").strip().lower()  # cards|list
     theme = os.environ.get("DASH_THEME", "dark").strip().lower()   # dark|light
@@ -385,28 +874,22 @@ def render_dashboard_png(
     img = Image.new("RGB", (W, H), bg)
     draw = ImageDraw.Draw(img)
 
-    font_path = _find_font()
-    if not font_path:
-        raise RuntimeError("No font found on system")
-
-    f_title = ImageFont.truetype(font_path, 64)
-    f_sub = ImageFont.truetype(font_path, 34)
-    f_h = ImageFont.truetype(font_path, 40)
-    f_txt = ImageFont.truetype(font_path, 32)
+    f_title = _load_font(px(64))
+    f_sub = _load_font(px(34))
+    f_h = _load_font(px(40))
+    f_txt = _load_font(px(32))
+    text_widths: dict = {}  # _wrap() measurement memo for this render
 
-    margin = 48
-    y = 210  # Zentriert für 2340px Höhe (extra ~200px oben für iPhone-Vollbild)
+    margin = px(48)
+    y = px(210)  # Zentriert für 2340px Höhe (extra ~200px oben für iPhone-Vollbild)
 
     # Header
     draw.text((margin, y), title, fill=white, font=f_title)
-    y += 80
+    y += px(80)
     draw.text((margin, y), subtitle, fill=muted, font=f_sub)
-    y += 58
+    y += px(58)
 
     # ---- icon helpers (drawn, not emoji) ----
-    ICON = (230, 236, 245)
-    ICON_MUTED = (160, 170, 190)
-
     def _weather_code_to_kind(code: int | None) -> str:
         # Open-Meteo weather codes: https://open-meteo.com/en/docs
         if code is None:
@@ -435,129 +918,52 @@ def render_dashboard_png(
             return "storm"
         return "cloud"
 
-    def _icon_sun(size: int) -> "Image.Image":
-        from PIL import Image
-        im = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        d = ImageDraw.Draw(im)
-        cx = cy = size // 2
-        r = int(size * 0.22)
-        d.ellipse((cx - r, cy - r, cx + r, cy + r), outline=ICON, width=6)
-        for a in range(0, 360, 45):
-            import math
-            rr1 = int(size * 0.34)
-            rr2 = int(size * 0.46)
-            x1 = cx + int(rr1 * math.cos(math.radians(a)))
-            y1 = cy + int(rr1 * math.sin(math.radians(a)))
-            x2 = cx + int(rr2 * math.cos(math.radians(a)))
-            y2 = cy + int(rr2 * math.sin(math.radians(a)))
-            d.line((x1, y1, x2, y2), fill=ICON, width=6)
-        return im
-
-    def _icon_cloud(size: int, rain: bool = False, snow: bool = False) -> "Image.Image":
-        from PIL import Image
-        im = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        d = ImageDraw.Draw(im)
-        y = int(size * 0.46)
-        d.ellipse((int(size * 0.18), y - int(size * 0.18), int(size * 0.44), y + int(size * 0.08)), outline=ICON, width=6)
-        d.ellipse((int(size * 0.36), y - int(size * 0.26), int(size * 0.66), y + int(size * 0.08)), outline=ICON, width=6)
-        d.ellipse((int(size * 0.56), y - int(size * 0.18), int(size * 0.82), y + int(size * 0.08)), outline=ICON, width=6)
-        d.rounded_rectangle((int(size * 0.18), y, int(size * 0.82), int(size * 0.70)), radius=18, outline=ICON, width=6)
-        if rain:
-            for i in range(3):
-                x = int(size * (0.30 + i * 0.18))
-                d.line((x, int(size * 0.74), x - 10, int(size * 0.90)), fill=ICON_MUTED, width=6)
-        if snow:
-            for i in range(3):
-                x = int(size * (0.30 + i * 0.18))
-                d.text((x - 10, int(size * 0.73)), "*", fill=ICON_MUTED, font=f_h)
-        return im
-
-    def _icon_fog(size: int) -> "Image.Image":
-        from PIL import Image
-        im = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        d = ImageDraw.Draw(im)
-        for j in range(4):
-            y = int(size * (0.30 + j * 0.14))
-            d.rounded_rectangle((int(size * 0.14), y, int(size * 0.86), y + 10), radius=8, outline=ICON_MUTED, width=4)
-        return im
-
-    def _icon_thermo(size: int, updown: str = "") -> "Image.Image":
-        from PIL import Image
-        im = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        d = ImageDraw.Draw(im)
-        # bulb
-        d.ellipse((int(size*0.36), int(size*0.60), int(size*0.64), int(size*0.88)), outline=ICON, width=6)
-        d.rounded_rectangle((int(size*0.46), int(size*0.18), int(size*0.54), int(size*0.70)), radius=10, outline=ICON, width=6)
-        if updown == "up":
-            d.polygon([(size*0.78, size*0.30), (size*0.90, size*0.48), (size*0.66, size*0.48)], outline=ICON_MUTED)
-        elif updown == "down":
-            d.polygon([(size*0.78, size*0.54), (size*0.90, size*0.36), (size*0.66, size*0.36)], outline=ICON_MUTED)
-        return im
-
-    def _icon_drop(size: int) -> "Image.Image":
-        from PIL import Image
-        im = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        d = ImageDraw.Draw(im)
-        d.polygon([(size*0.50, size*0.18), (size*0.70, size*0.52), (size*0.50, size*0.86), (size*0.30, size*0.52)], outline=ICON, width=6)
-        return im
-
-    def _icon_wind(size: int) -> "Image.Image":
-        from PIL import Image
-        im = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        d = ImageDraw.Draw(im)
-        for j in range(3):
-            y = int(size * (0.32 + j * 0.18))
-            d.arc((int(size*0.10), y, int(size*0.90), y+int(size*0.30)), start=0, end=180, fill=ICON, width=6)
-        return im
-
     def _pick_icon_for_weather(kind: str, size: int) -> "Image.Image":
         if kind == "sun":
-            return _icon_sun(size)
+            return _scaled_icon(_icon_sun, size, px(size))
         if kind in ("rain", "drizzle", "storm"):
-            return _icon_cloud(size, rain=True)
+            return _scaled_icon(_icon_cloud, size, px(size), rain=True)
         if kind == "snow":
-            return _icon_cloud(size, snow=True)
+            return _scaled_icon(_icon_cloud, size, px(size), snow=True)
         if kind == "fog":
-            return _icon_fog(size)
-        return _icon_cloud(size)
+            return _scaled_icon(_icon_fog, size, px(size))
+        return _scaled_icon(_icon_cloud, size, px(size))
 
     def _pick_icon_for_weather_line(line_kind: str, size: int) -> "Image.Image":
         if line_kind == "temp":
-            return _icon_thermo(size)
+            return _scaled_icon(_icon_thermo, size, px(size))
         if line_kind == "range":
-            return _icon_thermo(size)  # Tief/Hoch range
+            return _scaled_icon(_icon_thermo, size, px(size))  # Tief/Hoch range
         if line_kind == "humidity":
-            return _icon_drop(size)
+            return _scaled_icon(_icon_drop, size, px(size))
         if line_kind == "wind":
-            return _icon_wind(size)
-        return _icon_cloud(size)
+            return _scaled_icon(_icon_wind, size, px(size))
+        return _scaled_icon(_icon_cloud, size, px(size))
 
     def _rounded_with_shadow(x: int, y: int, w: int, h: int, radius: int, fill_rgb: Tuple[int,int,int]):
         """Draw a rounded rect with subtle shadow (Apple-ish)."""
         if style == "cards":
-            # shadow layer
-            from PIL import Image
-            shadow_layer = Image.new("RGBA", (w + 40, h + 40), (0, 0, 0, 0))
-            sd = ImageDraw.Draw(shadow_layer)
-            sd.rounded_rectangle([20, 20, 20 + w, 20 + h], radius=radius, fill=(*shadow, shadow_alpha))
-            shadow_layer = shadow_layer.filter(ImageFilter.GaussianBlur(18))
-            img.paste(shadow_layer, (x - 20, y - 10), shadow_layer)
+            pad = px(20)
+            shadow_layer = _shadow_sprite(w, h, radius, (*shadow, shadow_alpha), pad, 18 * scale)
+            img.paste(shadow_layer, (x - pad, y - px(10)), shadow_layer)
 
         # card itself
         draw.rounded_rectangle([x, y, x + w, y + h], radius=radius, fill=fill_rgb)
 
     def card_block(x: int, y: int, w: int, h: int, header: str, lines: List[str], bgcol, *, icon_mode: str = "none") -> int:
-        r = 34 if style == "cards" else 20
+        r = px(34) if style == "cards" else px(20)
         if style == "cards":
             _rounded_with_shadow(x, y, w, h, r, bgcol)
         else:
             # list/grouped: subtle background, minimal card feel
             _rounded_with_shadow(x, y, w, h, r, bgcol)
 
-        draw.text((x + 34, y + 26), header, fill=white, font=f_h)
+        draw.text((x + px(34), y + px(26)), header, fill=white, font=f_h)
 
-        yy = y + 86
-        max_w = w - 68
+        yy = y + px(86)
+        max_w = w - px(68)
+        line_h = px(44)
+        bottom = y + h - px(40)
 
         def _clean_todo(s: str) -> str:
             s = (s or "").strip()
@@ -573,25 +979,29 @@ def render_dashboard_png(
         is_todos = _h in {"to-dos", "to‑dos", "to-do", "to‑do", "todos", "to dos"}
         is_calendar = _h in {"termine", "kalender", "calendar", "events"}
 
+        # Hanging-indent widths: the bullet is constant and time prefixes
+        # repeat, so measure each once per card.
+        bullet_w = draw.textbbox((0, 0), "• ", font=f_txt)[2]
+        time_w_cache: dict[str, int] = {}
+
         for i, ln in enumerate(lines):
             if is_todos:
                 ln = "• " + _clean_todo(ln)
 
-            base_x = x + 34
+            base_x = x + px(34)
 
             # 1) Hanging indent for bullet lines so wrapped text aligns nicely.
             if ln.startswith("• "):
                 prefix = "• "
-                bullet_w = draw.textbbox((0, 0), prefix, font=f_txt)[2]
                 content = ln[len(prefix):].lstrip()
-                wrapped_lines = _wrap(draw, content, f_txt, max_w - bullet_w)
+                wrapped_lines = _wrap(draw, content, f_txt, max_w - bullet_w, text_widths)
                 for j, wrapped in enumerate(wrapped_lines):
                     if j == 0:
                         draw.text((base_x, yy), prefix + wrapped, fill=muted, font=f_txt)
                     else:
                         draw.text((base_x + bullet_w, yy), wrapped, fill=muted, font=f_txt)
-                    yy += 44
-                    if yy > y + h - 40:
+                    yy += line_h
+                    if yy > bottom:
                         return yy
 
             # 2) Calendar-style hanging indent: keep the time aligned, indent wrapped lines after it.
@@ -600,55 +1010,57 @@ def render_dashboard_png(
                 if len(first) == 2 and len(first[0]) in (4, 5) and first[0].count(":") == 1:
                     time_prefix = first[0] + " "
                     content = first[1].strip()
-                    time_w = draw.textbbox((0, 0), time_prefix, font=f_txt)[2]
-                    wrapped_lines = _wrap(draw, content, f_txt, max_w - time_w)
+                    time_w = time_w_cache.get(time_prefix)
+                    if time_w is None:
+                        time_w = time_w_cache[time_prefix] = draw.textbbox((0, 0), time_prefix, font=f_txt)[2]
+                    wrapped_lines = _wrap(draw, content, f_txt, max_w - time_w, text_widths)
                     for j, wrapped in enumerate(wrapped_lines):
                         if j == 0:
                             draw.text((base_x, yy), time_prefix + wrapped, fill=muted, font=f_txt)
                         else:
                             draw.text((base_x + time_w, yy), wrapped, fill=muted, font=f_txt)
-                        yy += 44
-                        if yy > y + h - 40:
+                        yy += line_h
+                        if yy > bottom:
                             return yy
                 else:
-                    wrapped_lines = _wrap(draw, ln, f_txt, max_w)
+                    wrapped_lines = _wrap(draw, ln, f_txt, max_w, text_widths)
                     for wrapped in wrapped_lines:
                         draw.text((base_x, yy), wrapped, fill=muted, font=f_txt)
-                        yy += 44
-                        if yy > y + h - 40:
+                        yy += line_h
+                        if yy > bottom:
                             return yy
 
             # 3) Default wrap (weather, birthdays, etc.)
             else:
-                wrapped_lines = _wrap(draw, ln, f_txt, max_w)
+                wrapped_lines = _wrap(draw, ln, f_txt, max_w, text_widths)
                 for wrapped in wrapped_lines:
                     draw.text((base_x, yy), wrapped, fill=muted, font=f_txt)
-                    yy += 44
-                    if yy > y + h - 40:
+                    yy += line_h
+                    if yy > bottom:
                         return yy
 
             # dividers
-            if yy < y + h - 60:
-                line_y = yy + 8
+            if yy < y + h - px(60):
+                line_y = yy + px(8)
                 # for list style: always divider between entries; for cards: only for todos
                 if style == "list" or is_todos:
-                    draw.line((x + 34, line_y, x + w - 34, line_y), fill=divider, width=2)
-                    yy += 24
+                    draw.line((x + px(34), line_y, x + w - px(34), line_y), fill=divider, width=px(2))
+                    yy += px(24)
 
         return yy
 
     # Layout: 4 vertical sections (stacked) for more room (esp. To-dos)
-    gap = 22
+    gap = px(22)
     card_w = W - 2 * margin
 
     # Heights tuned for original 1920px content area (unabhängig von Canvas-Größe)
-    h_weather = 280  # Kompakter da Höchst/Tiefst jetzt kombiniert
-    h_calendar = 360
-    h_birthdays = 300  # Etwas größer für 7-day preview (war 260)
+    h_weather = px(280)  # Kompakter da Höchst/Tiefst jetzt kombiniert
+    h_calendar = px(360)
+    h_birthdays = px(300)  # Etwas größer für 7-day preview (war 260)
     # Fixe Inhaltshöhe wie bei 1920px Canvas (1920 - 44 top - 40 bottom = 1836)
-    content_height = 1836
+    content_height = px(1836)
     remaining = content_height - (h_weather + h_calendar + h_birthdays + 3 * gap)
-    h_todos = max(520, remaining)
+    h_todos = max(px(520), remaining)
 
     # Weather icon mode: "mini" (one big icon) or "lines" (icon per line)
     weather_icon_mode = os.environ.get("DASH_WEATHER_ICON_MODE", "mini").strip().lower()
@@ -656,18 +1068,19 @@ def render_dashboard_png(
         weather_icon_mode = "mini"
 
     def weather_block(x: int, y0: int, w: int, h: int, weather_obj: dict) -> None:
-        r = 34 if style == "cards" else 20
+        r = px(34) if style == "cards" else px(20)
         _rounded_with_shadow(x, y0, w, h, r, card)
-        draw.text((x + 34, y0 + 26), "Wetter", fill=white, font=f_h)
+        draw.text((x + px(34), y0 + px(26)), "Wetter", fill=white, font=f_h)
 
         # Big icon (top-right, etwas höher damit nicht auf Trennlinie)
         if icons_on:
             kind = _weather_code_to_kind(weather_obj.get("weather_code"))
             big = _pick_icon_for_weather(kind, 140)
-            img.paste(big, (x + w - 34 - 140, y0 + 6), big)
+            img.paste(big, (x + w - px(34) - big.width, y0 + px(6)), big)
 
-        yy = y0 + 92
-        max_w = w - 68
+        yy = y0 + px(92)
+        max_w = w - px(68)
+        line_h = px(44)
 
         # Build tidy rows (label + value) instead of free-form strings.
         label_map = {
@@ -699,11 +1112,11 @@ def render_dashboard_png(
 
         # Column layout
         use_line_icon = icons_on and (weather_icon_mode == "lines")
-        icon_w = 54 if use_line_icon else 0
-        label_w = 240  # fixed label column for a clean look
-        col_gap = 16
+        icon_w = px(54) if use_line_icon else 0
+        label_w = px(240)  # fixed label column for a clean look
+        col_gap = px(16)
 
-        x0 = x + 34
+        x0 = x + px(34)
         label_x = x0 + icon_w
         value_x = label_x + label_w + col_gap
         value_w = max_w - icon_w - label_w - col_gap
@@ -711,25 +1124,25 @@ def render_dashboard_png(
         for idx, (lk, label, value) in enumerate(rows):
             if use_line_icon:
                 ic = _pick_icon_for_weather_line(lk, 44)
-                img.paste(ic, (x0, yy - 6), ic)
+                img.paste(ic, (x0, yy - px(6)), ic)
 
             # label (muted)
             draw.text((label_x, yy), label, fill=muted, font=f_txt)
 
             # value (brighter, right column)
-            for j, wrapped in enumerate(_wrap(draw, value, f_txt, value_w)):
-                draw.text((value_x, yy + j * 44), wrapped, fill=white, font=f_txt)
-                if yy + (j + 1) * 44 > y0 + h - 40:
+            for j, wrapped in enumerate(_wrap(draw, value, f_txt, value_w, text_widths)):
+                draw.text((value_x, yy + j * line_h), wrapped, fill=white, font=f_txt)
+                if yy + (j + 1) * line_h > y0 + h - px(40):
                     break
 
-            yy += 44
-            if yy > y0 + h - 40:
+            yy += line_h
+            if yy > y0 + h - px(40):
                 break
 
             # subtle dividers (helps "aufgeräumt")
-            if yy < y0 + h - 60:
-                draw.line((x + 34, yy + 6, x + w - 34, yy + 6), fill=divider, width=2)
-                yy += 18
+            if yy < y0 + h - px(60):
+                draw.line((x + px(34), yy + px(6), x + w - px(34), yy + px(6)), fill=divider, width=px(2))
+                yy += px(18)
 
     y0 = y
     weather_block(margin, y0, card_w, h_weather, weather)
@@ -746,10 +1159,59 @@ def render_dashboard_png(
     card_block(margin, y0, card_w, h_birthdays, "Geburtstage (7 Tage)", b_lines[:5], card2)
 
     buf = io.BytesIO()
-    img.save(buf, format="PNG", optimize=True)
+    if fmt == "jpeg":
+        # 4:4:4 - chroma subsampling fringes colored text
+        img.save(buf, format="JPEG", quality=90, optimize=True, progressive=True, subsampling=0)
+        return buf.getvalue()
+
+    # Flat UI with few distinct colors: an adaptive palette gives a much
+    # smaller 8-bit PNG; skip `optimize` (second zlib pass) - upload size
+    # barely changes but encoding gets noticeably slower.
+    try:
+        png_colors = int(os.environ.get("DASH_PNG_COLORS", "64"))
+    except ValueError:
+        png_colors = 64
+    out = img.quantize(colors=min(png_colors, 256)) if png_colors > 0 else img
+
+    out.save(buf, format="PNG", optimize=False, compress_level=6)
     return buf.getvalue()
 
 
+RENDER_CACHE_MAX_AGE = 3600  # seconds
+
+
+def _render_dashboard_cached(fmt: str, **inputs) -> bytes:
+    """render_dashboard_png(), reusing the last image if nothing changed.
+
+    The digest covers all render inputs plus the DASH_* settings, so a
+    re-run within the hour (manual trigger, retry) with identical data
+    skips rendering and encoding.
+    """
+    settings = {k: v for k, v in os.environ.items() if k.startswith("DASH_")}
+    key = json.dumps([inputs, settings, fmt], default=str, sort_keys=True)
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    path = os.path.join(CACHE_DIR, f"last_{digest}.{fmt}")
+
+    try:
+        if time.time() - os.path.getmtime(path) < RENDER_CACHE_MAX_AGE:
+            with open(path, "rb") as f:
+                return f.read()
+    except OSError:
+        pass
+
+    image = render_dashboard_png(fmt=fmt, **inputs)
+
+    try:
+        _atomic_write(path, image)
+        # keep only the latest render
+        for name in os.listdir(CACHE_DIR):
+            if name.startswith("last_") and name != os.path.basename(path):
+                os.unlink(os.path.join(CACHE_DIR, name))
+    except OSError as e:
+        print(f"⚠️ Render cache write failed: {e}")
+    return image
+
+
 # ------------------ Main ------------------
 
 def get_greeting() -> str:
@@ -797,20 +1259,44 @@ def build_text_dashboard(today_str: str, greeting: str, weather_lines: List[str]
     return "\n".join(lines)
 
 
+def _future_result(future, fallback):
+    """Return the future's result, or `fallback` if the task raised."""
+    try:
+        return future.result()
+    except Exception as e:
+        print(f"⚠️ Data source failed: {e}")
+        return fallback
+
+
 def main() -> int:
     today = datetime.now()
     today_str = today.strftime("%d.%m.%Y")
     greeting = get_greeting()
 
-    weather = get_weather()
-    weather_lines = [x for x in (weather.get("lines") or []) if x]
-    events = get_calendar()
-    todos = get_todos_lines()
-    birthdays = get_upcoming_birthdays(days=7)
+    # Data sources are independent and mostly wait on I/O (HTTP, khal, disk),
+    # so fetch them concurrently. Each result falls back on its own.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        f_weather = pool.submit(get_weather)
+        f_events = pool.submit(get_calendar)
+        f_todos = pool.submit(get_todos_lines)
+        f_birthdays = pool.submit(get_upcoming_birthdays, days=7)
 
-    # 1) Try image dashboard
+    weather = _future_result(
+        f_weather, {"ok": False, "weather_code": None, "lines": [("info", "Wetterdaten nicht verfügbar")]}
+    )
+    weather_lines = [x for x in (weather.get("lines") or []) if x]
+    events = _future_result(f_events, ["Keine Termine"])
+    todos = _future_result(f_todos, ["Keine To-dos für heute"])
+    birthdays = _future_result(f_birthdays, [])
+
+    # 1) Try image dashboard (palette PNG is smallest for this flat UI;
+    #    DASH_FORMAT=jpeg is opt-in)
+    fmt = os.environ.get("DASH_FORMAT", "png").strip().lower()
+    if fmt not in {"jpeg", "png"}:
+        fmt = "png"
     try:
-        png = render_dashboard_png(
+        image = _render_dashboard_cached(
+            fmt,
             title=greeting,
             subtitle=f"Rathenow · {today_str}",
             weather=weather,
@@ -818,7 +1304,7 @@ def main() -> int:
             todos=todos,
             birthdays=birthdays,
         )
-        ok_img = send_telegram_photo(png, caption=None)
+        ok_img = send_telegram_photo(image, caption=None, fmt=fmt)
         if ok_img:
             # Text-Version nur auf Wunsch (Daniel-Präferenz). Aktuell NICHT automatisch senden.
             print("✅ Image dashboard sent")